@@ -9,15 +9,46 @@ Monitors Home Assistant for:
 import logging
 import os
 import re
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 _LOGGER = logging.getLogger(__name__)
 
 # Supervisor API endpoints
 SUPERVISOR_URL = "http://supervisor"
+SUPERVISOR_TIMEOUT = 30  # seconds
+
+# Retry transient Supervisor failures on the pooled connection
+SUPERVISOR_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),  # template rendering is read-only
+)
+
+# Rendered by Home Assistant: every cover entity ID, one per line
+COVER_IDS_TEMPLATE = "{% for s in states.cover %}{{ s.entity_id }}\n{% endfor %}"
+
+# Rendered by Home Assistant over the watched entity IDs so only unavailable
+# ones are sent back, one "entity_id|friendly_name" per line
+UNAVAILABLE_COVERS_TEMPLATE = (
+    "{% for eid in watched if is_state(eid, 'unavailable') %}"
+    "{{ eid }}|{{ state_attr(eid, 'friendly_name') or eid }}\n"
+    "{% endfor %}"
+)
+
+# How often the set of watched Zigbee covers is rediscovered (seconds)
+WATCHED_REFRESH_INTERVAL = 3600
+
+# How long update info is reused before re-querying (seconds)
+UPDATE_CACHE_TTL = 300
+ADDON_CACHE_TTL = 600
 
 @dataclass
 class SystemStatus:
@@ -55,24 +86,51 @@ class HAMonitor:
         self.check_zigbee = check_zigbee
         self.check_updates = check_updates
         self.zigbee_patterns = zigbee_patterns or ["lumi", "zha", "zigbee"]
+        self._zigbee_re = self._compile_zigbee_patterns(self.zigbee_patterns)
+
+        # Cached Supervisor responses: endpoint -> (fetch time, data)
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+
+        # Zigbee cover entity IDs to poll and when they were last discovered
+        self._watched: List[str] = []
+        self._watched_at: Optional[float] = None
+
+        # Unavailable devices seen on the previous poll, for transition logging
+        self._prev_unavailable: Set[str] = set()
+
         self._token = os.environ.get("SUPERVISOR_TOKEN")
 
         if not self._token:
             _LOGGER.warning("SUPERVISOR_TOKEN not found - API calls will fail")
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get API request headers."""
-        return {
+        # Persistent session so polls reuse keep-alive connections to the Supervisor
+        self._session = requests.Session()
+        self._session.headers.update({
             "Authorization": f"Bearer {self._token}",
             "Content-Type": "application/json"
-        }
-
-    def _api_get(self, endpoint: str) -> Optional[Dict]:
+        })
+        self._session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=SUPERVISOR_RETRY)
+        )
+
+        # Worker pool for issuing independent Supervisor requests concurrently:
+        # one slot for the template-based Zigbee cover check plus four for the
+        # update checks
+        self._executor = ThreadPoolExecutor(max_workers=5)
+
+    def close(self) -> None:
+        """Shut down the worker pool and close the HTTP session."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def _api_get(self, endpoint: str, ttl: float = 0) -> Optional[Dict]:
         """
         Make GET request to Supervisor API.
 
         Args:
             endpoint: API endpoint path
+            ttl: Seconds a successful response may be reused (0 disables caching)
 
         Returns:
             Response data or None on error
@@ -80,20 +138,59 @@ class HAMonitor:
         if not self._token:
             return None
 
+        if ttl > 0:
+            cached = self._cache.get(endpoint)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
         try:
             url = f"{SUPERVISOR_URL}{endpoint}"
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, timeout=SUPERVISOR_TIMEOUT)
             response.raise_for_status()
-            return response.json().get("data", {})
+            data = response.json().get("data", {})
         except requests.exceptions.RequestException as e:
             _LOGGER.error(f"API request failed for {endpoint}: {e}")
             return None
 
+        if ttl > 0:
+            self._cache[endpoint] = (time.monotonic(), data)
+        return data
+
+    def _render_template(
+        self, name: str, template: str, variables: Optional[Dict] = None
+    ) -> Optional[str]:
+        """
+        Render a template via the Core API.
+
+        Args:
+            name: Short description of the request, used in error logs
+            template: Jinja template source
+            variables: Variables available to the template
+
+        Returns:
+            Rendered text or None on error
+        """
+        if not self._token:
+            return None
+
+        payload = {"template": template}
+        if variables:
+            payload["variables"] = variables
+
+        try:
+            url = f"{SUPERVISOR_URL}/core/api/template"
+            response = self._session.post(url, json=payload, timeout=SUPERVISOR_TIMEOUT)
+            response.raise_for_status()
+            return response.text
+        except requests.exceptions.RequestException as e:
+            _LOGGER.error(f"Template request failed for {name}: {e}")
+            return None
+
     def _check_core_updates(self) -> List[str]:
         """Check for Home Assistant Core updates."""
         updates = []
 
-        data = self._api_get("/core/info")
+        data = self._api_get("/core/info", ttl=UPDATE_CACHE_TTL)
         if data and data.get("update_available"):
             current = data.get("version", "unknown")
             latest = data.get("version_latest", "unknown")
@@ -105,7 +202,7 @@ class HAMonitor:
         """Check for Home Assistant OS updates."""
         updates = []
 
-        data = self._api_get("/os/info")
+        data = self._api_get("/os/info", ttl=UPDATE_CACHE_TTL)
         if data and data.get("update_available"):
             current = data.get("version", "unknown")
             latest = data.get("version_latest", "unknown")
@@ -117,7 +214,7 @@ class HAMonitor:
         """Check for add-on updates."""
         updates = []
 
-        data = self._api_get("/addons")
+        data = self._api_get("/addons", ttl=ADDON_CACHE_TTL)
         if data:
             addons = data.get("addons", [])
             for addon in addons:
@@ -131,7 +228,7 @@ class HAMonitor:
         """Check for Supervisor updates."""
         updates = []
 
-        data = self._api_get("/supervisor/info")
+        data = self._api_get("/supervisor/info", ttl=UPDATE_CACHE_TTL)
         if data and data.get("update_available"):
             current = data.get("version", "unknown")
             latest = data.get("version_latest", "unknown")
@@ -149,11 +246,19 @@ class HAMonitor:
         if not self.check_updates:
             return []
 
+        checks = (
+            self._check_core_updates,
+            self._check_os_updates,
+            self._check_supervisor_updates,
+            self._check_addon_updates,
+        )
+        futures = [self._executor.submit(check) for check in checks]
+
         all_updates = []
-        all_updates.extend(self._check_core_updates())
-        all_updates.extend(self._check_os_updates())
-        all_updates.extend(self._check_supervisor_updates())
-        all_updates.extend(self._check_addon_updates())
+        # All checks are already in flight; collect in submission order so
+        # the update list keeps the same order on every poll
+        for future in futures:
+            all_updates.extend(future.result())
 
         if all_updates:
             _LOGGER.info(f"Found {len(all_updates)} pending updates")
@@ -162,6 +267,29 @@ class HAMonitor:
 
         return all_updates
 
+    @staticmethod
+    def _compile_zigbee_patterns(patterns: List[str]) -> "re.Pattern[str]":
+        """
+        Compile Zigbee entity ID patterns into a single regex.
+
+        Patterns containing '*' are wildcards anchored at the start of the
+        entity ID; all other patterns match anywhere as plain substrings.
+
+        Args:
+            patterns: List of entity ID patterns
+
+        Returns:
+            Compiled case-insensitive regex matching any of the patterns
+        """
+        alternatives = []
+        for pattern in patterns:
+            if "*" in pattern:
+                # Support simple wildcards
+                alternatives.append("^" + re.escape(pattern).replace(r"\*", ".*"))
+            else:
+                alternatives.append(re.escape(pattern))
+        return re.compile("|".join(alternatives) or "(?!)", re.IGNORECASE)
+
     def _matches_zigbee_pattern(self, entity_id: str) -> bool:
         """
         Check if entity ID matches Zigbee device patterns.
@@ -172,23 +300,35 @@ class HAMonitor:
         Returns:
             True if entity matches a Zigbee pattern
         """
-        entity_lower = entity_id.lower()
-        for pattern in self.zigbee_patterns:
-            # Support simple wildcards
-            if "*" in pattern:
-                regex = pattern.replace(".", r"\.").replace("*", ".*")
-                if re.match(regex, entity_lower):
-                    return True
-            elif pattern.lower() in entity_lower:
-                return True
-        return False
+        return self._zigbee_re.search(entity_id) is not None
+
+    def _refresh_watched_covers(self) -> None:
+        """Discover cover entities that match the Zigbee patterns."""
+        text = self._render_template("cover discovery", COVER_IDS_TEMPLATE)
+        if text is None:
+            # Keep the previous list until the next refresh rather than
+            # retrying discovery on every poll during an outage
+            if self._watched_at is not None:
+                self._watched_at = time.monotonic()
+                _LOGGER.warning(
+                    f"Keeping previous list of {len(self._watched)} watched covers"
+                )
+            return
+
+        self._watched = [
+            entity_id for entity_id in text.split()
+            if self._matches_zigbee_pattern(entity_id)
+        ]
+        self._watched_at = time.monotonic()
+        _LOGGER.debug(f"Watching {len(self._watched)} Zigbee cover entities")
 
     def check_zigbee_devices(self) -> List[str]:
         """
         Check for unavailable Zigbee devices.
 
         Only checks cover entities (blinds) to avoid false positives from
-        button, number, and other auxiliary entities.
+        button, number, and other auxiliary entities. Matching covers are
+        discovered hourly; each poll only asks Home Assistant about those.
 
         Returns:
             List of unavailable device entity IDs
@@ -196,39 +336,38 @@ class HAMonitor:
         if not self.check_zigbee:
             return []
 
-        unavailable = []
+        if (
+            self._watched_at is None
+            or time.monotonic() - self._watched_at >= WATCHED_REFRESH_INTERVAL
+        ):
+            self._refresh_watched_covers()
+            if self._watched_at is None:
+                return []
 
-        # Get all entity states via Core API
-        try:
-            url = f"{SUPERVISOR_URL}/core/api/states"
-            response = requests.get(url, headers=self._get_headers(), timeout=15)
-            response.raise_for_status()
-            states = response.json()
-        except requests.exceptions.RequestException as e:
-            _LOGGER.error(f"Failed to get entity states: {e}")
-            return []
+        unavailable = []
 
-        for state in states:
-            entity_id = state.get("entity_id", "")
-            entity_state = state.get("state", "")
-
-            # Only check cover entities (the actual blinds)
-            # Skip buttons, numbers, sensors, and other auxiliary entities
-            if not entity_id.startswith("cover."):
-                continue
-
-            # Check if this is a Zigbee device
-            if self._matches_zigbee_pattern(entity_id):
-                # Check if unavailable
-                if entity_state == "unavailable":
-                    friendly_name = state.get("attributes", {}).get(
-                        "friendly_name", entity_id
-                    )
-                    unavailable.append(friendly_name)
-                    _LOGGER.warning(f"Zigbee device unavailable: {friendly_name}")
-
-        if unavailable:
+        if self._watched:
+            text = self._render_template(
+                "unavailable covers", UNAVAILABLE_COVERS_TEMPLATE, {"watched": self._watched}
+            )
+            if text is None:
+                return []
+
+            for line in text.splitlines():
+                entity_id, _, friendly_name = line.partition("|")
+                if entity_id:
+                    unavailable.append(friendly_name or entity_id)
+
+        # Only log devices that changed state since the previous poll
+        current = set(unavailable)
+        for name in sorted(current - self._prev_unavailable):
+            _LOGGER.warning(f"Zigbee device unavailable: {name}")
+        for name in sorted(self._prev_unavailable - current):
+            _LOGGER.info(f"Zigbee device recovered: {name}")
+
+        if current != self._prev_unavailable and unavailable:
             _LOGGER.info(f"Found {len(unavailable)} unavailable Zigbee devices")
+        self._prev_unavailable = current
 
         return unavailable
 
@@ -242,12 +381,15 @@ class HAMonitor:
         status = SystemStatus()
 
         try:
+            # Run the Zigbee cover template check while the update checks run
+            zigbee_future = self._executor.submit(self.check_zigbee_devices)
+
             # Check for updates
             status.pending_updates = self.check_for_updates()
             status.updates_available = len(status.pending_updates) > 0
 
             # Check Zigbee devices
-            status.unavailable_devices = self.check_zigbee_devices()
+            status.unavailable_devices = zigbee_future.result()
             status.zigbee_issues = len(status.unavailable_devices) > 0
 
         except Exception as e:
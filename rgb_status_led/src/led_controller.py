@@ -6,14 +6,12 @@ Supports both PWM method (GPIO18/12/13) and SPI method (GPIO10).
 """
 
 import logging
-from typing import Tuple
+from typing import Dict, Tuple
 
-try:
-    from rpi_ws281x import PixelStrip, Color, ws
-    HAS_WS281X = True
-except ImportError:
-    HAS_WS281X = False
-    logging.warning("rpi_ws281x not available - running in simulation mode")
+# rpi_ws281x is imported on first initialize() so loading this module does
+# not pull in the C extension (e.g. in simulation mode)
+PixelStrip = Color = ws = None
+HAS_WS281X = False
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +32,42 @@ class StatusColor:
     WHITE = (255, 255, 255)   # Test/bright
 
 
+# Packed ws281x values for the predefined status colors, filled by _load_ws281x()
+_COLOR_CACHE: Dict[Tuple[int, int, int], int] = {}
+
+
+def _load_ws281x() -> bool:
+    """
+    Import the rpi_ws281x library.
+
+    Returns:
+        True if the library is available, False otherwise
+    """
+    global PixelStrip, Color, ws, HAS_WS281X
+
+    if HAS_WS281X:
+        return True
+
+    try:
+        from rpi_ws281x import PixelStrip, Color, ws
+    except ImportError:
+        return False
+
+    HAS_WS281X = True
+    _COLOR_CACHE.update({
+        color: Color(*color)
+        for color in (
+            StatusColor.GREEN,
+            StatusColor.AMBER,
+            StatusColor.RED,
+            StatusColor.BLUE,
+            StatusColor.OFF,
+            StatusColor.WHITE,
+        )
+    })
+    return True
+
+
 class LEDController:
     """Controls WS281X LED strip for status indication."""
 
@@ -59,6 +93,7 @@ class LEDController:
         self.use_spi = use_spi
         self.strip = None
         self._current_color = StatusColor.OFF
+        self._dirty = True  # Pixel buffer not yet shown on the strip
         self._initialized = False
 
     def initialize(self) -> bool:
@@ -68,7 +103,7 @@ class LEDController:
         Returns:
             True if initialization successful, False otherwise
         """
-        if not HAS_WS281X:
+        if not _load_ws281x():
             _LOGGER.warning("WS281X library not available, running in simulation mode")
             self._initialized = True
             return True
@@ -125,21 +160,36 @@ class LEDController:
             _LOGGER.warning("LED strip not initialized")
             return
 
-        self._current_color = color
+        # Accept any 3-item sequence; the cache and comparisons need a tuple
+        color = tuple(color)
+
+        # Strip already showing this color - skip the redundant frame
+        if show and color == self._current_color and not self._dirty:
+            return
+
         r, g, b = color
 
         if not HAS_WS281X or self.strip is None:
+            self._current_color = color
+            self._dirty = not show
             _LOGGER.debug(f"[SIM] Setting color to RGB({r}, {g}, {b})")
             return
 
         try:
-            # Set all pixels to the same color
-            ws_color = Color(r, g, b)
+            # Set all pixels to the same color (bind the setter once for the loop)
+            ws_color = _COLOR_CACHE.get(color)
+            if ws_color is None:
+                ws_color = Color(r, g, b)
+            set_pixel = self.strip.setPixelColor
             for i in range(self.led_count):
-                self.strip.setPixelColor(i, ws_color)
+                set_pixel(i, ws_color)
+
+            self._current_color = color
+            self._dirty = True
 
             if show:
                 self.strip.show()
+                self._dirty = False
 
             _LOGGER.debug(f"Set LED color to RGB({r}, {g}, {b})")
         except Exception as e:
@@ -183,6 +233,7 @@ class LEDController:
         if HAS_WS281X and self.strip is not None:
             self.strip.setBrightness(self.brightness)
             self.strip.show()
+            self._dirty = False
 
         _LOGGER.debug(f"Brightness set to {brightness}%")
 
@@ -204,16 +255,19 @@ class LEDController:
         step_delay = duration / (steps * 2)
 
         try:
+            # Color is constant, so write the pixels once and only fade brightness
+            self.set_color(color, show=False)
+
             # Fade in
             for i in range(steps):
                 self.strip.setBrightness(int((i / steps) * original_brightness))
-                self.set_color(color, show=True)
+                self.strip.show()
                 time.sleep(step_delay)
 
             # Fade out
             for i in range(steps, 0, -1):
                 self.strip.setBrightness(int((i / steps) * original_brightness))
-                self.set_color(color, show=True)
+                self.strip.show()
                 time.sleep(step_delay)
 
             # Restore original brightness
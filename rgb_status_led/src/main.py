@@ -6,15 +6,15 @@ Exposes HTTP API for direct LED control from Home Assistant.
 All monitoring logic handled by HA automations.
 """
 
-import json
 import logging
 import signal
-import sys
-import time
+import threading
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+import orjson
 
 from led_controller import LEDController, StatusColor
 
@@ -26,18 +26,46 @@ logging.basicConfig(
 )
 _LOGGER = logging.getLogger("rgb_led_service")
 
+# Add-on options written by the Supervisor
+CONFIG_PATH = Path("/data/options.json")
+
+# Minimum interval between consecutive LED updates (seconds)
+LED_FRAME_INTERVAL = 0.02
+
 # Global LED controller
 led_controller = None
-shutdown_requested = False
+shutdown_event = threading.Event()
+reload_event = threading.Event()
+
+# Parsed options.json and the mtime it was read at
+_config_cache: Optional[Dict[str, Any]] = None
+_config_mtime: Optional[float] = None
+
+# Latest color requested over HTTP, applied by the LED worker thread.
+# The condition wakes the worker on a new color, reload or shutdown.
+pending_color: Optional[Tuple[int, int, int]] = None
+color_cond = threading.Condition()
 
 
 def load_config() -> Dict[str, Any]:
-    """Load add-on configuration from options.json."""
-    config_path = Path("/data/options.json")
+    """
+    Load add-on configuration from options.json.
+
+    The parsed file is cached and only re-read when its mtime changes.
+    """
+    global _config_cache, _config_mtime
+
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime
+    except FileNotFoundError:
+        mtime = None
 
-    if config_path.exists():
-        with open(config_path) as f:
-            return json.load(f)
+    if mtime is not None:
+        if _config_cache is None or mtime != _config_mtime:
+            with open(CONFIG_PATH, "rb") as f:
+                _config_cache = orjson.loads(f.read())
+            _config_mtime = mtime
+        return _config_cache
 
     # Default configuration
     _LOGGER.warning("No options.json found, using defaults")
@@ -50,19 +78,95 @@ def load_config() -> Dict[str, Any]:
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    global shutdown_requested
     _LOGGER.info(f"Received signal {signum}, shutting down...")
-    shutdown_requested = True
+    shutdown_event.set()
+
+
+def reload_handler(signum, frame):
+    """Handle SIGHUP by scheduling a configuration reload."""
+    _LOGGER.info("Received SIGHUP, reloading configuration...")
+    reload_event.set()
+    wake_led_worker()
+
 
-    if led_controller:
-        led_controller.clear()
+def apply_config() -> None:
+    """
+    Re-read options.json and apply settings that can change at runtime.
 
-    sys.exit(0)
+    On any error the current settings are kept.
+    """
+    try:
+        config = load_config()
+    except Exception as e:
+        _LOGGER.error(f"Failed to reload configuration, keeping current settings: {e}")
+        return
+
+    brightness = config.get("brightness")
+    if not isinstance(brightness, int) or not 1 <= brightness <= 100:
+        _LOGGER.error(
+            f"Invalid brightness in reloaded configuration: {brightness!r}, "
+            "keeping current settings"
+        )
+        return
+
+    led_controller.set_brightness(brightness)
+    _LOGGER.info(f"Brightness set to {brightness}%")
+    _LOGGER.info("GPIO pin and LED count changes require an add-on restart")
+
+
+def wake_led_worker() -> None:
+    """Wake the LED worker to re-check for pending work."""
+    with color_cond:
+        color_cond.notify()
+
+
+def _led_work_pending() -> bool:
+    """Check whether the LED worker has anything to do."""
+    return (
+        pending_color is not None
+        or reload_event.is_set()
+        or shutdown_event.is_set()
+    )
+
+
+def led_worker():
+    """Apply the most recently requested color, at most once per frame interval."""
+    global pending_color
+
+    while True:
+        # Sleep until there is work instead of polling
+        with color_cond:
+            color_cond.wait_for(_led_work_pending)
+            if shutdown_event.is_set():
+                return
+            color = pending_color
+            pending_color = None
+
+        try:
+            if reload_event.is_set():
+                reload_event.clear()
+                if led_controller:
+                    apply_config()
+
+            if color is not None and led_controller:
+                led_controller.set_color(color)
+        except Exception as e:
+            _LOGGER.error(f"LED worker error: {e}")
+
+        # Requests arriving within the frame interval collapse into one write
+        if color is not None:
+            shutdown_event.wait(LED_FRAME_INTERVAL)
 
 
 class LEDServiceHandler(BaseHTTPRequestHandler):
     """HTTP request handler for LED control."""
 
+    # Responses carry Content-Length, so clients can keep connections alive
+    protocol_version = "HTTP/1.1"
+
+    # Close idle kept-alive connections so they don't pin server threads
+    timeout = 30
+
     COLOR_MAP = {
         "green": StatusColor.GREEN,
         "amber": StatusColor.AMBER,
@@ -75,19 +179,16 @@ class LEDServiceHandler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         """Handle GET requests."""
-        global led_controller
+        global pending_color
 
         parsed = urlparse(self.path)
 
         # Health check endpoint
         if parsed.path == "/health":
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json({
                 "status": "ok",
                 "initialized": led_controller is not None and led_controller._initialized
-            }).encode())
+            })
             return
 
         # Set color endpoint: /set_color?color=green
@@ -106,21 +207,29 @@ class LEDServiceHandler(BaseHTTPRequestHandler):
             color = self.COLOR_MAP[color_name]
             _LOGGER.info(f"Setting LED color to: {color_name}")
 
-            if led_controller:
-                led_controller.set_color(color)
+            # Hand off to the LED worker; bursts collapse to the latest color
+            with color_cond:
+                pending_color = color
+                color_cond.notify()
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json({
                 "status": "ok",
                 "color": color_name
-            }).encode())
+            })
             return
 
         # Unknown endpoint
         self.send_error(404, "Endpoint not found. Available: /health, /set_color?color=green")
 
+    def _send_json(self, data: Dict[str, Any]) -> None:
+        """Send a 200 response with a JSON body."""
+        body = orjson.dumps(data)
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def log_message(self, format, *args):
         """Custom logging to use our logger."""
         _LOGGER.debug(f"{self.address_string()} - {format % args}")
@@ -133,6 +242,7 @@ def main():
     # Set up signal handlers
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGHUP, reload_handler)
 
     _LOGGER.info("=" * 50)
     _LOGGER.info("RGB LED Service Starting")
@@ -163,30 +273,39 @@ def main():
 
     # Start HTTP server
     port = 8099
-    server = HTTPServer(('0.0.0.0', port), LEDServiceHandler)
+    server = ThreadingHTTPServer(('0.0.0.0', port), LEDServiceHandler)
     _LOGGER.info(f"HTTP service listening on port {port}")
     _LOGGER.info("Available endpoints:")
     _LOGGER.info("  GET /health - Health check")
     _LOGGER.info("  GET /set_color?color=green - Set LED color")
     _LOGGER.info("  Valid colors: green, amber, red, blue, white, off")
 
-    # Show service is ready (green)
-    time.sleep(2)
-    led_controller.set_color(StatusColor.GREEN)
-    _LOGGER.info("Service ready - LED set to green")
+    # Show service is ready (green), unless shutdown was requested meanwhile
+    if not shutdown_event.wait(2):
+        led_controller.set_color(StatusColor.GREEN)
+        _LOGGER.info("Service ready - LED set to green")
+
+    # Drive the strip and serve requests in the background until a shutdown
+    # signal arrives
+    worker_thread = threading.Thread(target=led_worker, daemon=True)
+    worker_thread.start()
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
 
-    # Serve requests
     try:
-        while not shutdown_requested:
-            server.handle_request()
+        shutdown_event.wait()
     except KeyboardInterrupt:
         _LOGGER.info("Interrupted by user")
     except Exception as e:
         _LOGGER.error(f"Unexpected error: {e}")
     finally:
+        shutdown_event.set()
+        wake_led_worker()
+        server.shutdown()
         server.server_close()
+        worker_thread.join()
         if led_controller:
-            led_controller.clear()
+            led_controller.cleanup()
         _LOGGER.info("Shutdown complete")
 
 